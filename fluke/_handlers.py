@@ -1,4 +1,8 @@
 import os as _os
+import time as _time
+import shlex as _shlex
+import atexit as _atexit
+import threading as _threading
 from abc import ABC as _ABC
 from abc import abstractmethod as _absmethod
 from base64 import decodebytes as _decodebytes
@@ -10,6 +14,7 @@ import boto3 as _boto3
 import paramiko as _prmk
 from azure.identity import ClientSecretCredential as _CSC
 from azure.storage.blob import ContainerClient as _ContainerClient
+from botocore.config import Config as _BotoConfig
 from botocore.exceptions import ClientError as _CE
 from google.cloud.storage import Client as _GCSClient
 from google.api_core.page_iterator import HTTPIterator as _GCSHTTPIter
@@ -170,10 +175,11 @@ class ClientHandler(_ABC):
         '''
 
         def relativize_iter(iterator: _Iterator[str]):
+            sep = _infer_sep(dir_path)
             return map(lambda p: _relativize(
                 parent=dir_path,
                 child=p,
-                sep=_infer_sep(dir_path)
+                sep=sep
             ), iterator)
 
         if self.is_cacheable():
@@ -252,6 +258,23 @@ class ClientHandler(_ABC):
         pass
 
 
+    def close_thread_connections(self) -> None:
+        '''
+        Closes any connections that have been opened \
+        exclusively for the current thread, if any.
+        '''
+        pass
+
+
+    def is_thread_safe(self) -> bool:
+        '''
+        Returns ``True`` if the handler can be used \
+        by more than one thread at the same time, \
+        else returns ``False``.
+        '''
+        return True
+
+
     @_absmethod
     def path_exists(self, path: str) -> bool:
         '''
@@ -565,6 +588,210 @@ class FileSystemHandler(ClientHandler):
                 yield abs_path if show_abs_path else obj
 
 
+class _SSHConnectionPool():
+    '''
+    A class used in pooling authenticated SSH \
+    connections, so that they can be reused by \
+    any handlers that connect to the same remote \
+    server with the same credentials.
+
+    :param int max_pool_size: The maximum number of \
+        idle connections that are kept per remote server.
+    :param float max_idle_time: The number of seconds \
+        after which an idle connection is evicted.
+
+    :note: Idle connections are evicted whenever a \
+        connection is either acquired or released, as \
+        well as by a background timer, so that they do \
+        not remain open until the interpreter exits.
+    '''
+
+    def __init__(self, max_pool_size: int, max_idle_time: float):
+        '''
+        A class used in pooling authenticated SSH \
+        connections, so that they can be reused by \
+        any handlers that connect to the same remote \
+        server with the same credentials.
+
+        :param int max_pool_size: The maximum number of \
+            idle connections that are kept per remote server.
+        :param float max_idle_time: The number of seconds \
+            after which an idle connection is evicted.
+
+        :note: Idle connections are evicted whenever a \
+            connection is either acquired or released, as \
+            well as by a background timer, so that they do \
+            not remain open until the interpreter exits.
+        '''
+        self.__max_pool_size = max_pool_size
+        self.__max_idle_time = max_idle_time
+        self.__pools: dict[tuple, list[tuple[_prmk.SSHClient, float]]] = dict()
+        self.__timer: _Optional[_threading.Timer] = None
+        self.__lock = _threading.Lock()
+
+
+    def get(self, key: tuple) -> _Optional[_prmk.SSHClient]:
+        '''
+        Returns an idle connection that corresponds \
+        to the provided key, or ``None`` if no such \
+        connection exists.
+
+        :param tuple key: The key that identifies \
+            the connection.
+        '''
+        with self.__lock:
+            stale = self.__evict()
+            pool = self.__pools.get(key, [])
+            ssh = pool.pop()[0] if len(pool) > 0 else None
+        for conn in stale:
+            conn.close()
+        return ssh
+
+
+    def release(self, key: tuple, ssh: _prmk.SSHClient) -> None:
+        '''
+        Returns the provided connection to the pool \
+        so that it can be reused. If the pool is full, \
+        then the connection is closed instead.
+
+        :param tuple key: The key that identifies \
+            the connection.
+        :param SSHClient ssh: An ``SSHClient`` instance.
+        '''
+        with self.__lock:
+            stale = self.__evict()
+            if (
+                self.__is_usable(ssh, _time.monotonic()) and
+                len(self.__pools.get(key, [])) < self.__max_pool_size
+            ):
+                self.__pools.setdefault(key, []).append((ssh, _time.monotonic()))
+                self.__schedule()
+            else:
+                stale.append(ssh)
+        for conn in stale:
+            conn.close()
+
+
+    def clear(self) -> None:
+        '''
+        Closes all idle connections.
+        '''
+        with self.__lock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            pools = list(self.__pools.values())
+            self.__pools.clear()
+        for pool in pools:
+            for ssh, _ in pool:
+                ssh.close()
+
+
+    def __evict(self) -> list[_prmk.SSHClient]:
+        '''
+        Removes all connections that are no longer \
+        usable from the pool, regardless of their key, \
+        and returns them so that they can be closed.
+
+        :note: This method must be invoked while \
+            holding the pool's lock.
+        '''
+        stale = []
+        now = _time.monotonic()
+        for key in list(self.__pools):
+            pool = []
+            for ssh, released_at in self.__pools[key]:
+                if self.__is_usable(ssh, released_at, now):
+                    pool.append((ssh, released_at))
+                else:
+                    stale.append(ssh)
+            if len(pool) > 0:
+                self.__pools.update({key: pool})
+            else:
+                self.__pools.pop(key)
+        return stale
+
+
+    def __schedule(self) -> None:
+        '''
+        Schedules a background timer that evicts \
+        the oldest idle connection once it expires, \
+        unless such a timer has already been scheduled.
+
+        :note: This method must be invoked while \
+            holding the pool's lock.
+        '''
+        if self.__timer is not None or len(self.__pools) == 0:
+            return
+        oldest = min(
+            released_at
+            for pool in self.__pools.values()
+            for _, released_at in pool)
+        delay = oldest + self.__max_idle_time - _time.monotonic()
+        self.__timer = _threading.Timer(
+            interval=max(delay, 0.0),
+            function=self.__on_timer)
+        # NOTE: Do not keep the interpreter alive just
+        #       in order to close some idle connections.
+        self.__timer.daemon = True
+        self.__timer.start()
+
+
+    def __on_timer(self) -> None:
+        '''
+        Evicts any expired connections and reschedules \
+        the timer if there still exist idle connections.
+        '''
+        with self.__lock:
+            self.__timer = None
+            stale = self.__evict()
+            self.__schedule()
+        for ssh in stale:
+            ssh.close()
+
+
+    def __is_usable(
+        self,
+        ssh: _prmk.SSHClient,
+        released_at: float,
+        now: _Optional[float] = None
+    ) -> bool:
+        '''
+        Returns ``True`` if the provided connection \
+        is still active and has not been idle for \
+        too long, else returns ``False``.
+
+        :param SSHClient ssh: An ``SSHClient`` instance.
+        :param float released_at: The point in time at \
+            which the connection was released.
+        :param float | None now: The current point in time. \
+            Defaults to ``None``, in which case it is computed.
+        '''
+        if now is None:
+            now = _time.monotonic()
+        transport = ssh.get_transport()
+        return (
+            transport is not None and
+            transport.is_active() and
+            now - released_at < self.__max_idle_time
+        )
+
+
+_SSH_POOL = _SSHConnectionPool(max_pool_size=8, max_idle_time=60.0)
+_atexit.register(_SSH_POOL.clear)
+
+# NOTE: The default SFTP channel parameters. A large
+#       window lets many requests remain in flight over
+#       high-latency links, whereas the packet size is
+#       kept to the maximum that all servers accept.
+_SFTP_WINDOW_SIZE = 2 ** 27
+_SFTP_MAX_PACKET_SIZE = 2 ** 15
+
+# NOTE: The number of seconds to wait for a command
+#       that has been executed on a remote server.
+_SSH_EXEC_TIMEOUT = 10.0
+
+
 class SSHClientHandler(ClientHandler):
     '''
     A class used in handling the SSH and SFTP \
@@ -575,12 +802,23 @@ class SSHClientHandler(ClientHandler):
     :param DirCache | None cache: Either a ``DirCache`` \
         instance used for managing the cache, or ``None`` \
         if caching is not activated.
+    :param int window_size: The size in bytes of the \
+        SFTP channel's window. Defaults to ``128 MiB``.
+    :param int max_packet_size: The maximum size in bytes \
+        of the SFTP channel's packets. Defaults to ``32 KiB``.
+    :param bool allow_exec: Indicates whether it is allowed \
+        to execute ``mkdir -p`` on the remote server in order \
+        to create any missing directories via a single request. \
+        Defaults to ``False``.
     '''        
 
     def __init__(
         self,
         auth: _RemoteAuth,
-        cache: _Optional[_DirCache]
+        cache: _Optional[_DirCache],
+        window_size: int = _SFTP_WINDOW_SIZE,
+        max_packet_size: int = _SFTP_MAX_PACKET_SIZE,
+        allow_exec: bool = False
     ):
         '''
         A class used in handling the SSH and SFTP \
@@ -591,11 +829,28 @@ class SSHClientHandler(ClientHandler):
         :param DirCache | None cache: Either a ``DirCache`` \
             instance used for managing the cache, or ``None`` \
             if caching is not activated.
+        :param int window_size: The size in bytes of the \
+            SFTP channel's window. Defaults to ``128 MiB``.
+        :param int max_packet_size: The maximum size in bytes \
+            of the SFTP channel's packets. Defaults to ``32 KiB``.
+        :param bool allow_exec: Indicates whether it is allowed \
+            to execute ``mkdir -p`` on the remote server in order \
+            to create any missing directories via a single request. \
+            Defaults to ``False``.
         '''
         super().__init__(cache=cache)
         self.__auth: _RemoteAuth = auth
+        self.__window_size = window_size
+        self.__max_packet_size = max_packet_size
         self.__ssh: _prmk.SSHClient = None
         self.__sftp: _prmk.SFTPClient = None
+        self.__owner: _Optional[int] = None
+        self.__thread_conns: dict[
+            int, tuple[_prmk.SSHClient, _prmk.SFTPClient]] = dict()
+        self.__lock = _threading.Lock()
+        self.__pool_key: tuple = None
+        self.__sep: _Optional[str] = None
+        self.__can_exec = allow_exec
 
 
     def is_open(self) -> bool:
@@ -616,10 +871,38 @@ class SSHClientHandler(ClientHandler):
         if self.__ssh is not None:
             return
 
-        ssh = _prmk.SSHClient()
+        self.__ssh, self.__sftp = self.__connect()
+        self.__owner = _threading.get_ident()
+
+
+    def __connect(self) -> tuple[_prmk.SSHClient, _prmk.SFTPClient]:
+        '''
+        Returns an SSH connection to the remote server, \
+        along with an SFTP session opened over it. An idle \
+        connection from the pool is reused if one exists, \
+        else a new connection is established.
 
+        :note: A pooled connection may have been dropped by \
+            the remote server without its transport having \
+            noticed yet. If an SFTP session cannot be opened \
+            over such a connection, then it is closed and \
+            another connection is used instead.
+        '''
         credentials = self.__auth.get_credentials()
 
+        # Reuse an idle connection if one exists.
+        if self.__pool_key is None:
+            self.__pool_key = tuple(
+                (k, (v.type, v.key) if isinstance(v, _RemoteAuth.PublicKey) else v)
+                for k, v in sorted(credentials.items()))
+        while (ssh := _SSH_POOL.get(key=self.__pool_key)) is not None:
+            try:
+                return ssh, self.__open_sftp(ssh)
+            except (_prmk.SSHException, EOFError, OSError):
+                ssh.close()
+
+        ssh = _prmk.SSHClient()
+
         public_key = credentials.pop('public_key')
         verify_host = credentials.pop('verify_host')
 
@@ -661,21 +944,121 @@ class SSHClientHandler(ClientHandler):
         except _prmk.SSHException as e:
             raise e
 
-        self.__ssh = ssh
-        self.__sftp = ssh.open_sftp()
         print("Connection established!")
+        return ssh, self.__open_sftp(ssh)
+
+
+    def __open_sftp(self, ssh: _prmk.SSHClient) -> _prmk.SFTPClient:
+        '''
+        Opens and returns an SFTP session \
+        over the provided SSH connection.
+
+        :param SSHClient ssh: An ``SSHClient`` instance.
+        '''
+        return _prmk.SFTPClient.from_transport(
+            t=ssh.get_transport(),
+            window_size=self.__window_size,
+            max_packet_size=self.__max_packet_size)
+
+
+    def __get_sftp(self) -> _prmk.SFTPClient:
+        '''
+        Returns the SFTP session that is to be \
+        used by the current thread.
+
+        :note: An ``SFTPClient`` cannot be used by more \
+            than one thread at a time, as any thread may \
+            consume the responses to another thread's \
+            requests. Therefore, any thread other than the \
+            one that opened the handler's connection is \
+            assigned a dedicated SSH connection, which is \
+            checked out from the connection pool, until \
+            ``close_thread_connections`` is invoked. If the \
+            handler is not open, then ``None`` is returned.
+        '''
+        thread_id = _threading.get_ident()
+        if self.__owner is None or thread_id == self.__owner:
+            return self.__sftp
+        if (conn := self.__thread_conns.get(thread_id)) is None:
+            conn = self.__connect()
+            with self.__lock:
+                self.__thread_conns.update({thread_id: conn})
+        return conn[1]
 
 
     def close_connections(self):
         '''
         Closes the SSH/SFTP connection to \
         the remote server.
+
+        :note: The SFTP sessions are closed, whereas the \
+            SSH connections are released to a pool of idle \
+            connections, so that they can be reused by any \
+            handler that connects to the same server with \
+            the same credentials. Idle connections are closed \
+            after having been idle for a while, or upon exit.
         '''
+        with self.__lock:
+            conns = list(self.__thread_conns.values())
+            self.__thread_conns.clear()
         if self.__ssh is not None:
-            self.__sftp.close()
-            self.__sftp = None
-            self.__ssh.close()
+            conns.insert(0, (self.__ssh, self.__sftp))
             self.__ssh = None
+            self.__sftp = None
+            self.__owner = None
+        for conn in conns:
+            self.__release(*conn)
+
+
+    def close_thread_connections(self) -> None:
+        '''
+        Closes any connections that have been opened \
+        exclusively for the current thread, if any.
+        '''
+        with self.__lock:
+            conn = self.__thread_conns.pop(_threading.get_ident(), None)
+        if conn is not None:
+            self.__release(*conn)
+
+
+    def __release(
+        self,
+        ssh: _prmk.SSHClient,
+        sftp: _prmk.SFTPClient
+    ) -> None:
+        '''
+        Closes the provided SFTP session and releases \
+        the provided SSH connection to the pool.
+
+        :param SSHClient ssh: An ``SSHClient`` instance.
+        :param SFTPClient sftp: An ``SFTPClient`` instance.
+        '''
+        sftp.close()
+        # NOTE: Release the connection to the pool
+        #       instead of closing it, so that it can
+        #       be reused by other handlers.
+        _SSH_POOL.release(key=self.__pool_key, ssh=ssh)
+
+
+    def get_separator(self, path: str) -> str:
+        '''
+        Returns the remote file system's path \
+        separator, as inferred from the provided path.
+
+        :param str path: A path within the \
+            remote file system.
+
+        :note: As the separator cannot change for a \
+            given remote server, it is cached as soon \
+            as it is inferred from a path that actually \
+            contains it.
+        '''
+        if self.__sep is not None:
+            return self.__sep
+        sep = _infer_sep(path)
+        if sep in path:
+            self.__sep = sep
+        return sep
 
 
     def path_exists(self, path: str) -> bool:
@@ -688,12 +1071,12 @@ class SSHClientHandler(ClientHandler):
         # NOTE: Strip seperator at the end of the
         # path only if said path is not equal to
         # the separator itself.
-        sep = _infer_sep(path)
+        sep = self.get_separator(path)
         if path != sep:
             path = path.rstrip(sep)
         
         try:
-            self.__sftp.lstat(path=path)
+            self.__get_sftp().lstat(path=path)
         except FileNotFoundError:
             return False
         return True
@@ -710,11 +1093,11 @@ class SSHClientHandler(ClientHandler):
         # NOTE: Strip seperator at the end of the
         # path only if said path is not equal to
         # the separator itself.
-        sep = _infer_sep(file_path)
+        sep = self.get_separator(file_path)
         if file_path != sep:
             file_path = file_path.rstrip(sep)
 
-        return not _is_dir(self.__sftp.lstat(
+        return not _is_dir(self.__get_sftp().lstat(
             path=file_path).st_mode)
     
     
@@ -725,7 +1108,7 @@ class SSHClientHandler(ClientHandler):
         :param str path: The path of the directory \
             that is to be created.
         '''
-        self.__sftp.mkdir(path=path)
+        self.__get_sftp().mkdir(path=path)
 
 
     def get_reader(self, file_path: str) -> _RemoteFileReader:
@@ -740,7 +1123,7 @@ class SSHClientHandler(ClientHandler):
         return _RemoteFileReader(
             file_path=file_path,
             file_size=self.get_file_size(file_path),
-            sftp=self.__sftp)
+            sftp=self.__get_sftp())
 
 
     def get_writer(
@@ -765,8 +1148,72 @@ class SSHClientHandler(ClientHandler):
             is written. If ``None``, then the file is to be \
             written as a single chunk of bytes.
         '''
+        sftp = self.__get_sftp()
+        sep = self.get_separator(file_path)
         return _RemoteFileWriter(
-            file_path=file_path, sftp=self.__sftp)
+            file_path=file_path,
+            sftp=sftp,
+            sep=sep,
+            make_dirs=(
+                (lambda dir_path: self.__make_dirs(sftp, dir_path))
+                if self.__can_exec and sep == '/' else None))
+
+
+    def __make_dirs(self, sftp: _prmk.SFTPClient, dir_path: str) -> bool:
+        '''
+        Attempts to create the provided directory, along \
+        with any missing parent directories, by executing \
+        ``mkdir -p`` on the remote server, and returns \
+        ``True`` if this has been successful, else \
+        returns ``False``.
+
+        :param SFTPClient sftp: An ``SFTPClient`` \
+            class instance.
+        :param str dir_path: The absolute path of \
+            the directory in question.
+
+        :note: In case the remote server does not allow \
+            the execution of commands, e.g. when the user is \
+            restricted to SFTP, no further attempts are made. \
+            The same holds if the command does not appear to \
+            have any effect, e.g. due to it being executed in \
+            a different root directory than the SFTP session.
+        '''
+        if not self.__can_exec:
+            return False
+        try:
+            channel = sftp.get_channel().get_transport().open_session()
+        except _prmk.SSHException:
+            self.__can_exec = False
+            return False
+        try:
+            try:
+                channel.exec_command(f"mkdir -p {_shlex.quote(dir_path)}")
+            except _prmk.SSHException:
+                self.__can_exec = False
+                return False
+            # NOTE: Signal that no input is to be sent, so that
+            #       a server which enforces SFTP exits instead
+            #       of waiting for any requests.
+            channel.shutdown_write()
+            if not channel.status_event.wait(timeout=_SSH_EXEC_TIMEOUT):
+                self.__can_exec = False
+                return False
+            # NOTE: A non-zero exit status may only concern this
+            #       specific path, e.g. due to lacking permissions,
+            #       so keep executing commands for any other paths.
+            if channel.recv_exit_status() != 0:
+                return False
+            # NOTE: Make sure that the command has
+            #       actually created the directory.
+            try:
+                sftp.stat(path=dir_path)
+                return True
+            except FileNotFoundError:
+                self.__can_exec = False
+                return False
+        finally:
+            channel.close()
 
 
     def _get_file_size_impl(self, file_path) -> int:
@@ -775,7 +1222,7 @@ class SSHClientHandler(ClientHandler):
 
         :param str file_path: The path of the file in question.
         '''
-        return self.__sftp.lstat(path=file_path).st_size
+        return self.__get_sftp().lstat(path=file_path).st_size
     
 
     def _get_file_metadata_impl(self, file_path: str) -> dict[str, str]:
@@ -815,7 +1262,7 @@ class SSHClientHandler(ClientHandler):
         :note: The resulting iterator may vary depending on the \
             value of parameter ``recursively``.
         '''
-        sep = _infer_sep(dir_path)
+        sep = self.get_separator(dir_path)
 
         if recursively:
 
@@ -845,11 +1292,11 @@ class SSHClientHandler(ClientHandler):
                     yield abs_path
 
             for attr in sorted(
-                self.__sftp.listdir_iter(path=dir_path),
+                self.__get_sftp().listdir_iter(path=dir_path),
                 key=lambda at: at.filename
             ):
                 for file_path in filter_obj(
-                    sftp=self.__sftp,
+                    sftp=self.__get_sftp(),
                     attr=attr,
                     parent_dir=dir_path
                 ):
@@ -860,7 +1307,7 @@ class SSHClientHandler(ClientHandler):
                             sep=sep))
         else:
             for attr in sorted(
-                self.__sftp.listdir_iter(path=dir_path),
+                self.__get_sftp().listdir_iter(path=dir_path),
                 key=lambda at: at.filename
             ):
                 path = attr.filename
@@ -870,6 +1317,14 @@ class SSHClientHandler(ClientHandler):
                     if show_abs_path else path
 
 
+# NOTE: The default maximum number of HTTP connections
+#       that are kept open to Amazon S3. This needs to be
+#       large enough so that concurrent requests, issued
+#       either for distinct files or for distinct parts of
+#       the same file, do not have to wait for a connection.
+_S3_MAX_POOL_CONNECTIONS = 64
+
+
 class AWSClientHandler(ClientHandler):
     '''
     A class used in handling the HTTP \
@@ -882,13 +1337,17 @@ class AWSClientHandler(ClientHandler):
     :param DirCache | None cache: Either a ``DirCache`` \
         instance used for managing the cache, or ``None`` \
         if caching is not activated.
+    :param int max_pool_connections: The maximum number \
+        of HTTP connections that are kept open to Amazon S3. \
+        Defaults to ``64``.
     '''
 
     def __init__(
         self,
         auth: _AWSAuth,
         bucket: str,
-        cache: _Optional[_DirCache]
+        cache: _Optional[_DirCache],
+        max_pool_connections: int = _S3_MAX_POOL_CONNECTIONS
     ):
         '''
         A class used in handling the HTTP \
@@ -901,11 +1360,18 @@ class AWSClientHandler(ClientHandler):
         :param DirCache | None cache: Either a ``DirCache`` \
             instance used for managing the cache, or ``None`` \
             if caching is not activated.
+        :param int max_pool_connections: The maximum number \
+            of HTTP connections that are kept open to Amazon S3. \
+            Defaults to ``64``.
         '''
         super().__init__(cache=cache)
         self.__auth = auth
         self.__bucket_name = bucket
         self.__bucket = None
+        self.__max_pool_connections = max_pool_connections
+        self.__owner: _Optional[int] = None
+        self.__thread_buckets: dict[int, '_boto3.resources.factory.s3.Bucket'] = dict()
+        self.__lock = _threading.Lock()
 
 
     def get_bucket_name(self) -> str:
@@ -934,10 +1400,8 @@ class AWSClientHandler(ClientHandler):
             return
 
         print(f"\nEstablishing connection to '{self.__bucket_name}' Amazon S3 bucket...")
-        self.__bucket = _boto3.resource(
-            service_name='s3',
-            **self.__auth.get_credentials()
-        ).Bucket(self.__bucket_name)
+        self.__bucket = self.__create_bucket()
+        self.__owner = _threading.get_ident()
         # Ensure that bucket exists.
         try:
             self.__bucket.meta.client.head_bucket(Bucket=self.__bucket_name)
@@ -952,9 +1416,61 @@ class AWSClientHandler(ClientHandler):
         '''
         Closes the HTTP connection to the Amazon S3 bucket.
         '''
+        with self.__lock:
+            buckets = list(self.__thread_buckets.values())
+            self.__thread_buckets.clear()
         if self.__bucket is not None:
-            self.__bucket.meta.client.close()
+            buckets.insert(0, self.__bucket)
             self.__bucket = None
+            self.__owner = None
+        for bucket in buckets:
+            bucket.meta.client.close()
+
+
+    def close_thread_connections(self) -> None:
+        '''
+        Closes any connections that have been opened \
+        exclusively for the current thread, if any.
+        '''
+        with self.__lock:
+            bucket = self.__thread_buckets.pop(_threading.get_ident(), None)
+        if bucket is not None:
+            bucket.meta.client.close()
+
+
+    def __create_bucket(self) -> '_boto3.resources.factory.s3.Bucket':
+        '''
+        Creates and returns a new ``Bucket`` resource \
+        through a session of its own.
+        '''
+        return _boto3.session.Session().resource(
+            service_name='s3',
+            config=_BotoConfig(
+                max_pool_connections=self.__max_pool_connections),
+            **self.__auth.get_credentials()
+        ).Bucket(self.__bucket_name)
+
+
+    def __get_bucket(self) -> '_boto3.resources.factory.s3.Bucket':
+        '''
+        Returns the ``Bucket`` resource that is \
+        to be used by the current thread.
+
+        :note: As ``boto3`` resources are not thread-safe, \
+            any thread other than the one that opened the \
+            handler's connection is assigned a resource of \
+            its own, until ``close_thread_connections`` is \
+            invoked. If the handler is not open, then \
+            ``None`` is returned.
+        '''
+        thread_id = _threading.get_ident()
+        if self.__owner is None or thread_id == self.__owner:
+            return self.__bucket
+        if (bucket := self.__thread_buckets.get(thread_id)) is None:
+            bucket = self.__create_bucket()
+            with self.__lock:
+                self.__thread_buckets.update({thread_id: bucket})
+        return bucket
 
 
     def path_exists(self, path: str) -> bool:
@@ -983,7 +1499,7 @@ class AWSClientHandler(ClientHandler):
         '''
         try:
             file_path = file_path.rstrip(_infer_sep(file_path))
-            self.__bucket.Object(file_path).load()
+            self.__get_bucket().Object(file_path).load()
             return not self.dir_exists(file_path)
         except _CE:
             return False
@@ -997,7 +1513,7 @@ class AWSClientHandler(ClientHandler):
         :param str path: Either an absolute path or a \
             path relative to the parent directory.
         '''
-        return 'CommonPrefixes' in self.__bucket.meta.client.list_objects(
+        return 'CommonPrefixes' in self.__get_bucket().meta.client.list_objects(
             Bucket=self.get_bucket_name(),
             Prefix=path.rstrip(_infer_sep(path)),
             Delimiter='/',
@@ -1011,7 +1527,7 @@ class AWSClientHandler(ClientHandler):
         :param str path: The path of the directory \
             that is to be created.
         '''
-        self.__bucket.put_object(
+        self.__get_bucket().put_object(
             Key=path,
             ContentType='application/x-directory; charset=UTF-8')
         
@@ -1028,7 +1544,7 @@ class AWSClientHandler(ClientHandler):
         return _AmazonS3FileReader(
             file_path=file_path,
             file_size=self.get_file_size(file_path),
-            bucket=self.__bucket)
+            bucket=self.__get_bucket())
 
 
     def get_writer(
@@ -1057,7 +1573,7 @@ class AWSClientHandler(ClientHandler):
             file_path=file_path,
             metadata=metadata,
             chunk_size=chunk_size,
-            bucket=self.__bucket)
+            bucket=self.__get_bucket())
     
 
     def _get_file_size_impl(self, file_path) -> int:
@@ -1067,7 +1583,7 @@ class AWSClientHandler(ClientHandler):
         :param str file_path: The absolute path of the \
             file in question.
         '''
-        return self.__bucket.Object(key=file_path).content_length
+        return self.__get_bucket().Object(key=file_path).content_length
     
 
     def _get_file_metadata_impl(self, file_path: str) -> dict[str, str]:
@@ -1076,7 +1592,7 @@ class AWSClientHandler(ClientHandler):
 
         :param str file_path: The path of the file in question.
         '''
-        return self.__bucket.Object(key=file_path).metadata
+        return self.__get_bucket().Object(key=file_path).metadata
 
 
     def _traverse_dir_impl(
@@ -1105,7 +1621,7 @@ class AWSClientHandler(ClientHandler):
         :note: The resulting iterator may vary depending on the \
             value of parameter ``recursively``.
         '''
-        paginator = self.__bucket.meta.client.get_paginator('list_objects')
+        paginator = self.__get_bucket().meta.client.get_paginator('list_objects')
 
         sep = _infer_sep(dir_path)
 
@@ -1159,6 +1675,11 @@ class AWSClientHandler(ClientHandler):
                         obj = next(obj_iter, None)
 
 
+# NOTE: The size of the blocks in which
+#       blobs are uploaded to Azure.
+_AZURE_BLOCK_SIZE = 8 * 1024 * 1024
+
+
 class AzureClientHandler(ClientHandler):
     '''
     A class used in handling the HTTP \
@@ -1235,12 +1756,14 @@ class AzureClientHandler(ClientHandler):
         if 'conn_string' in credentials:
             self.__container = _ContainerClient.from_connection_string(
                 conn_str=credentials['conn_string'],
-                container_name=self.__container_name)
+                container_name=self.__container_name,
+                max_block_size=_AZURE_BLOCK_SIZE)
         else:
             self.__container = _ContainerClient(
                 account_url=credentials.pop('account_url'),
                 container_name=self.__container_name,
-                credential=_CSC(**credentials))
+                credential=_CSC(**credentials),
+                max_block_size=_AZURE_BLOCK_SIZE)
             
         if not self.container_exists():
             self.close_connections()
@@ -1481,6 +2004,19 @@ class GCPClientHandler(ClientHandler):
         return self.__bucket is not None
 
 
+    def is_thread_safe(self) -> bool:
+        '''
+        Returns ``True`` if the handler can be used \
+        by more than one thread at the same time, \
+        else returns ``False``.
+
+        :note: The Google Cloud Storage client, which is \
+            shared by all readers and writers, is not meant \
+            to be used by more than one thread at a time.
+        '''
+        return False
+
+
     def open_connections(self) -> None:
         '''
         Opens an HTTP connection to the \
@@ -1,13 +1,18 @@
 import os as _os
 import io as _io
+import queue as _queue
 from abc import ABC as _ABC
 from abc import abstractmethod as _absmethod
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 from typing import Optional as _Optional
 from typing import Iterator as _Iterator
+from typing import BinaryIO as _BinaryIO
+from typing import Callable as _Callable
 
 
 import paramiko as _prmk
 import boto3 as _boto3
+from boto3.s3.transfer import TransferConfig as _TransferConfig
 from azure.storage.blob import ContainerClient as _ContainerClient
 from azure.storage.blob import BlobType as _BlobType
 from google.cloud.storage import Bucket as _GCPBucket
@@ -18,7 +23,120 @@ from botocore.exceptions import ClientError as _BotoClientError
 from azure.core.exceptions import HttpResponseError as _AzureResponseError
 
 
-from ._helper import infer_separator as _infer_sep
+# NOTE: The default buffer size used when reading from
+#       or writing to local files. This is considerably
+#       larger than Python's default buffer size so that
+#       fewer system calls are issued during large copies.
+_COPY_BUFSIZE = 1024 * 1024
+
+# NOTE: The size above which objects that are uploaded
+#       to Amazon S3 in a single go are uploaded in parts,
+#       which are transmitted concurrently.
+_S3_MULTIPART_THRESHOLD = 64 * 1024 * 1024
+
+# NOTE: The maximum number of read requests that are
+#       in flight while prefetching a remote file. Each
+#       request asks for at most 32 KiB, so this bounds the
+#       amount of prefetched data that has yet to be read.
+_SFTP_MAX_PREFETCH_REQUESTS = 128
+
+# NOTE: A pool of buffers of size "_COPY_BUFSIZE" which
+#       are reused across copies so that a new buffer need
+#       not be allocated every time a file is copied. The
+#       pool is bounded so that any buffers allocated during
+#       a burst of concurrent copies are not kept forever.
+_BUF_POOL: _queue.LifoQueue[bytearray] = _queue.LifoQueue(maxsize=4)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, count: int) -> int:
+    '''
+    Copies up to ``count`` bytes from the beginning of \
+    the source file into the destination file without \
+    passing them through user space, and returns the \
+    number of bytes that were copied.
+
+    :param int src_fd: The source file's descriptor.
+    :param int dst_fd: The destination file's descriptor.
+    :param int count: The number of bytes to be copied.
+
+    :note: This function first attempts to use ``copy_file_range``, \
+        falling back to ``sendfile`` if the former is either not \
+        supported or fails. If both fail, then the number of bytes \
+        that have been copied so far is returned, so that the rest \
+        of them can be copied through user space.
+    '''
+    offset = 0
+    for copy in (
+        lambda: _os.copy_file_range(src_fd, dst_fd, count - offset, offset),
+        lambda: _os.sendfile(dst_fd, src_fd, offset, count - offset)
+    ):
+        try:
+            while offset < count:
+                if (n := copy()) == 0:
+                    return offset
+                offset += n
+            return offset
+        # NOTE: Either the function is not available on this
+        #       platform, or the operation is not supported for
+        #       these files (e.g. "EXDEV" across file systems).
+        except (AttributeError, OSError):
+            continue
+    return offset
+
+
+def _copy_fileobj(src: _BinaryIO, dst: _BinaryIO) -> int:
+    '''
+    Copies the contents of the source file object, \
+    starting from its current position, into the \
+    destination file object, and returns the number \
+    of bytes that were copied.
+
+    :param BinaryIO src: The source file object.
+    :param BinaryIO dst: The destination file object.
+
+    :note: The contents are read directly into a buffer \
+        which is taken from a pool of reusable buffers, \
+        and which is returned to the pool afterwards, \
+        unless the pool is already full.
+    '''
+    try:
+        buffer = _BUF_POOL.get_nowait()
+    except _queue.Empty:
+        buffer = bytearray(_COPY_BUFSIZE)
+    n = 0
+    try:
+        with memoryview(buffer) as view:
+            while (k := src.readinto(buffer)):
+                n += dst.write(view[:k])
+    finally:
+        try:
+            _BUF_POOL.put_nowait(buffer)
+        except _queue.Full:
+            pass
+    return n
+
+
+def _tune(size: int) -> tuple[int, int]:
+    '''
+    Returns a ``(chunk_size, concurrency)`` tuple \
+    containing the parameters that are considered \
+    suitable for transferring the provided number \
+    of bytes over the network.
+
+    :param int size: The number of bytes \
+        that are to be transferred.
+
+    :note: Small payloads are transferred serially, \
+        whereas larger payloads are split into larger \
+        chunks which are transferred concurrently.
+    '''
+    mib = 1024 * 1024
+    if size < 50 * mib:
+        return 5 * mib, 1
+    elif size < 250 * mib:
+        return 16 * mib, 4
+    else:
+        return 64 * mib, 16
 
 
 class _IOHandler(_ABC):
@@ -30,6 +148,8 @@ class _IOHandler(_ABC):
         handler's underlying file.
     '''
 
+    __slots__ = ('_file_path', '_offset')
+
     def __init__(self, file_path: str):
         '''
         An abstract class which serves as the \
@@ -38,8 +158,8 @@ class _IOHandler(_ABC):
         :param str file_path: The path of the \
             handler's underlying file.
         '''
-        self.__file_path = file_path
-        self.__offset = None
+        self._file_path = file_path
+        self._offset = None
 
 
     def get_file_path(self) -> str:
@@ -47,7 +167,7 @@ class _IOHandler(_ABC):
         Returns the path of the handler's \
         underlying file.
         '''
-        return self.__file_path
+        return self._file_path
     
 
     def get_offset(self) -> _Optional[int]:
@@ -58,7 +178,7 @@ class _IOHandler(_ABC):
             it is invoked during the reading/writing of \
             data in distinct chunks.
         '''
-        return self.__offset
+        return self._offset
     
 
     def set_offset(self, offset: _Optional[int]) -> None:
@@ -67,7 +187,7 @@ class _IOHandler(_ABC):
 
         :param int | None offset: The new offset.
         '''
-        self.__offset = offset
+        self._offset = offset
 
 
     @_absmethod
@@ -102,6 +222,8 @@ class _FileReader(_IOHandler, _ABC):
         handler's underlying file.
     '''
 
+    __slots__ = ('_file_size',)
+
     def __init__(self, file_path: str, file_size: int):
         '''
         An abstract class which serves as the \
@@ -113,7 +235,7 @@ class _FileReader(_IOHandler, _ABC):
             the file in question.
         '''
         super().__init__(file_path)
-        self.__file_size = file_size
+        self._file_size = file_size
 
 
     def get_file_size(self) -> int:
@@ -121,7 +243,7 @@ class _FileReader(_IOHandler, _ABC):
         Returns the size in bytes of the \
         handler's underlying file.
         '''
-        return self.__file_size
+        return self._file_size
 
 
     def get_mode(self) -> str:
@@ -158,18 +280,18 @@ class _FileReader(_IOHandler, _ABC):
         :param int offset: The point within the file to begin \
             reading bytes chunks from.
         '''
-        self.set_offset(offset=offset)
+        self._offset = offset
         start = offset
         end = start + chunk_size
-        file_size = self.get_file_size()
+        file_size = self._file_size
         while start < file_size:
             chunk = self._read_impl(start, end)
             n = len(chunk)
             start += n
             end += n
-            self.set_offset(offset=start)
+            self._offset = start
             yield chunk
-        self.set_offset(offset=None)
+        self._offset = None
 
 
     def read_range(
@@ -193,9 +315,9 @@ class _FileReader(_IOHandler, _ABC):
             start = max(0, start)
 
         if end is None:
-            end = self.get_file_size()
+            end = self._file_size
         else:
-            end = min(self.get_file_size(), end)
+            end = min(self._file_size, end)
 
         if start >= end:
             return b""
@@ -227,6 +349,8 @@ class _FileWriter(_IOHandler, _ABC):
         handler's underlying file.
     '''
 
+    __slots__ = ()
+
     def __init__(self, file_path: str):
         '''
         An abstract class which serves as the \
@@ -238,7 +362,7 @@ class _FileWriter(_IOHandler, _ABC):
             the file in question.
         '''
         super().__init__(file_path)
-        self.set_offset(offset=0)
+        self._offset = 0
 
 
     def get_mode(self) -> str:
@@ -264,8 +388,21 @@ class _FileWriter(_IOHandler, _ABC):
             to be written to the file.
         '''
         n = self._write_impl(chunk=chunk)
-        self.set_offset(self.get_offset() + n)
+        self._offset += n
         return n
+    
+
+    def write_from(self, reader: _FileReader) -> int:
+        '''
+        Writes the whole contents of the file that \
+        corresponds to the provided reader into the \
+        opened file, and returns the number of bytes \
+        written.
+
+        :param _FileReader reader: A ``_FileReader`` \
+            class instance.
+        '''
+        return self.write(chunk=reader.read())
 
 
     @_absmethod
@@ -291,6 +428,8 @@ class LocalFileReader(_FileReader):
         the file in question.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(self, file_path: str, file_size: int) -> None:
         '''
         A class used in reading from files which \
@@ -302,7 +441,10 @@ class LocalFileReader(_FileReader):
             the file in question.
         '''
         super().__init__(file_path=file_path, file_size=file_size)
-        self.__file = open(file=file_path, mode=self.get_mode())
+        self.__file = open(
+            file=file_path,
+            mode=self.get_mode(),
+            buffering=_COPY_BUFSIZE)
 
 
     def close(self) -> None:
@@ -312,6 +454,27 @@ class LocalFileReader(_FileReader):
         self.__file.close()
 
 
+    def fileno(self) -> int:
+        '''
+        Returns the underlying file's descriptor.
+        '''
+        return self.__file.fileno()
+
+
+    def read_into(self, file: _BinaryIO, offset: int = 0) -> int:
+        '''
+        Reads the file starting from the provided offset, \
+        writes its contents into the provided file object, \
+        and returns the number of bytes written.
+
+        :param BinaryIO file: A binary file object.
+        :param int offset: The offset to start \
+            reading from. Defaults to ``0``.
+        '''
+        self.__file.seek(offset)
+        return _copy_fileobj(src=self.__file, dst=file)
+
+
     def _read_impl(
         self,
         start: int,
@@ -336,6 +499,8 @@ class LocalFileWriter(_FileWriter):
         the file in question.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(self, file_path: str) -> None:
         '''
         A class used in writing to files which \
@@ -348,7 +513,10 @@ class LocalFileWriter(_FileWriter):
         # Create necessary directories if they do not exist.
         _os.makedirs(name=_os.path.dirname(file_path), exist_ok=True)
         # Open file for writing.
-        self.__file = open(file=file_path, mode=self.get_mode())
+        self.__file = open(
+            file=file_path,
+            mode=self.get_mode(),
+            buffering=_COPY_BUFSIZE)
 
 
     def close(self) -> None:
@@ -366,8 +534,52 @@ class LocalFileWriter(_FileWriter):
         :param bytes chunk: The chunk of bytes that \
             is to be written to the file.
         '''
-        n = self.__file.write(chunk)
+        # NOTE: Do not flush after each chunk, so that
+        #       any small chunks are coalesced within the
+        #       file's buffer. The buffer is flushed as soon
+        #       as the file is closed.
+        return self.__file.write(chunk)
+    
+
+    def write_from(self, reader: _FileReader) -> int:
+        '''
+        Writes the whole contents of the file that \
+        corresponds to the provided reader into the \
+        opened file, and returns the number of bytes \
+        written.
+
+        :param _FileReader reader: A ``_FileReader`` \
+            class instance.
+
+        :note: If the provided reader reads from a local \
+            file as well, then the file's contents are \
+            copied by the kernel without ever going \
+            through user space. If it reads from a remote \
+            file, then the file's contents are streamed \
+            into the local file block by block.
+        '''
+        if isinstance(reader, RemoteFileReader):
+            n = reader.read_into(file=self.__file)
+            self._offset += n
+            return n
+        
+        if not isinstance(reader, LocalFileReader):
+            return super().write_from(reader=reader)
+        
         self.__file.flush()
+        n = _kernel_copy(
+            src_fd=reader.fileno(),
+            dst_fd=self.__file.fileno(),
+            count=reader._file_size)
+        # NOTE: Synchronize the buffered file's position
+        #       with that of the underlying descriptor.
+        self.__file.seek(0, _os.SEEK_END)
+        self._offset += n
+        # Copy any remaining bytes through user space.
+        if n < reader._file_size:
+            m = reader.read_into(file=self.__file, offset=n)
+            self._offset += m
+            n += m
         return n
     
 
@@ -384,6 +596,8 @@ class RemoteFileReader(_FileReader):
         class instance.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(
         self,
         file_path: str,
@@ -413,6 +627,27 @@ class RemoteFileReader(_FileReader):
         self.__file.close()
 
 
+    def read_into(self, file: _BinaryIO) -> int:
+        '''
+        Reads the whole file, writes its contents into \
+        the provided file object, and returns the number \
+        of bytes written.
+
+        :param BinaryIO file: A binary file object.
+
+        :note: The file's contents are prefetched and streamed \
+            in distinct blocks. At most ``128`` read requests, i.e. \
+            ``4 MiB``, are in flight at any time, so that the file's \
+            contents are never held in memory all at once, even if \
+            the provided file is written to slowly.
+        '''
+        self.__file.seek(0)
+        self.__file.prefetch(
+            file_size=self._file_size,
+            max_concurrent_requests=_SFTP_MAX_PREFETCH_REQUESTS)
+        return _copy_fileobj(src=self.__file, dst=file)
+
+
     def _read_impl(
         self,
         start: int,
@@ -424,6 +659,11 @@ class RemoteFileReader(_FileReader):
         :param int start: The point to start reading from.
         :param int end: The point to stop reading from.
         '''
+        # NOTE: Any range spanning multiple SFTP requests is
+        #       read via "readv", which issues all requests at
+        #       once instead of waiting for each one in turn.
+        if end - start > self.__file.MAX_REQUEST_SIZE:
+            return b''.join(self.__file.readv([(start, end - start)]))
         self.__file.seek(start)
         return self.__file.read(end - start)
 
@@ -437,12 +677,25 @@ class RemoteFileWriter(_FileWriter):
         the file in question.
     :param SFTPClient sftp: An ``SFTPClient`` \
         class instance.
+    :param str sep: The remote file system's \
+        path separator.
+    :param Callable[[str], bool] | None make_dirs: A \
+        function which attempts to create the provided \
+        directory, along with any missing parent directories, \
+        via a single request, and returns ``True`` if this has \
+        been successful, else returns ``False``. If ``None``, \
+        then each missing directory is created separately. \
+        Defaults to ``None``.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(
         self,
         file_path: str,
-        sftp: _prmk.SFTPClient
+        sftp: _prmk.SFTPClient,
+        sep: str,
+        make_dirs: _Optional[_Callable[[str], bool]] = None
     ) -> None:
         '''
         A class used in writing to files which \
@@ -452,37 +705,59 @@ class RemoteFileWriter(_FileWriter):
             the file in question.
         :param SFTPClient sftp: An ``SFTPClient`` \
             class instance.
+        :param str sep: The remote file system's \
+            path separator.
+        :param Callable[[str], bool] | None make_dirs: A \
+            function which attempts to create the provided \
+            directory, along with any missing parent directories, \
+            via a single request, and returns ``True`` if this has \
+            been successful, else returns ``False``. If ``None``, \
+            then each missing directory is created separately. \
+            Defaults to ``None``.
         '''
         super().__init__(file_path=file_path)
 
-        sep = _infer_sep(file_path)
-
-        def get_parent_dir(file_path: str) -> _Optional[str]:
-            '''
-            Returns the path to the parent directory \
-            of the provided file path. Returns ``None`` \
-            if said directory is the root directory.
-
-            :param str file_path: The path of the file \
-                in question.
-            '''
-            file_path = file_path.removesuffix(sep)
-            if sep in file_path:
-                return f"{sep.join(file_path.split(sep)[:-1])}{sep}"
-            return None
-
         # Create any directories necessary.
-        parent_dir, non_existing_dirs = file_path, []
-        while (parent_dir := get_parent_dir(parent_dir)) is not None:
+        # NOTE: Each parent directory's path is a prefix of the
+        #       file's path, ending right after a separator, so
+        #       walk the path backwards from separator to separator.
+        #       Stop probing as soon as an existing directory has
+        #       been found, since this implies that all of its
+        #       parent directories exist as well.
+        end, non_existing_dirs = len(file_path.rstrip(sep)), []
+        while (end := file_path.rfind(sep, 0, end)) != -1:
+            parent_dir = file_path[:end+1]
             try:
                 sftp.stat(path=parent_dir)
+                break
             except FileNotFoundError:
+                # NOTE: Once the file's immediate parent directory
+                #       is known to be missing, try creating all
+                #       missing directories via a single request
+                #       instead of probing each one of them.
+                if (
+                    not non_existing_dirs and
+                    make_dirs is not None and
+                    make_dirs(parent_dir)
+                ):
+                    break
                 non_existing_dirs.append(parent_dir)
         for dir in reversed(non_existing_dirs):
-            sftp.mkdir(path=dir)
+            try:
+                sftp.mkdir(path=dir)
+            except IOError as e:
+                # NOTE: Ignore the error in case the directory
+                #       has been created in the meantime.
+                try:
+                    sftp.stat(path=dir)
+                except FileNotFoundError:
+                    raise e
 
         self.__file: _prmk.SFTPFile = sftp.open(
             filename=file_path, mode=self.get_mode())
+        # NOTE: Do not wait for the server to acknowledge
+        #       each write before issuing the next one.
+        self.__file.set_pipelined(True)
         
 
     def close(self) -> None:
@@ -492,6 +767,30 @@ class RemoteFileWriter(_FileWriter):
         self.__file.close()
 
 
+    def write_from(self, reader: _FileReader) -> int:
+        '''
+        Writes the whole contents of the file that \
+        corresponds to the provided reader into the \
+        opened file, and returns the number of bytes \
+        written.
+
+        :param _FileReader reader: A ``_FileReader`` \
+            class instance.
+
+        :note: If the provided reader reads from a local \
+            file, then the file's contents are streamed \
+            into the remote file block by block, without \
+            waiting for each write to be acknowledged, \
+            instead of being loaded into memory all at once.
+        '''
+        if not isinstance(reader, LocalFileReader):
+            return super().write_from(reader=reader)
+        n = 0
+        for chunk in reader.read_chunks(chunk_size=_COPY_BUFSIZE):
+            n += self.write(chunk=chunk)
+        return n
+
+
     def _write_impl(self, chunk: bytes) -> int:
         '''
         Writes the provided chunk to the opened file,
@@ -517,6 +816,8 @@ class AmazonS3FileReader(_FileReader):
     :param Bucket bucket: A ``Bucket`` class instance.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(
         self,
         file_path: str,
@@ -558,9 +859,32 @@ class AmazonS3FileReader(_FileReader):
 
         :param int start: The point to start reading from.
         :param int end: The point to stop reading from.
-        ''' 
-        range = f"bytes={start}-{end-1}"
-        return self.__file.get(Range=range)['Body'].read()
+
+        :note: Any sufficiently large byte range is downloaded \
+            by issuing multiple concurrent ranged ``GetObject`` \
+            requests.
+        '''
+        part_size, max_workers = _tune(end - start)
+
+        if max_workers == 1:
+            byte_range = f"bytes={start}-{end-1}"
+            return self.__file.get(Range=byte_range)['Body'].read()
+
+        # NOTE: Use the underlying client, as it is,
+        #       unlike resources, thread-safe.
+        client = self.__file.meta.client
+
+        def get_part(part_start: int) -> bytes:
+            part_end = min(part_start + part_size, end)
+            return client.get_object(
+                Bucket=self.__file.bucket_name,
+                Key=self.__file.key,
+                Range=f"bytes={part_start}-{part_end-1}"
+            )['Body'].read()
+
+        with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return b''.join(executor.map(
+                get_part, range(start, end, part_size)))
 
             
 class AmazonS3FileWriter(_FileWriter):
@@ -580,6 +904,15 @@ class AmazonS3FileWriter(_FileWriter):
         written as a single chunk of bytes.
     :param Bucket bucket: A ``Bucket`` class instance.
     '''
+
+    __slots__ = (
+        '__file',
+        '__mpu',
+        '__parts',
+        '__pending',
+        '__metadata'
+    )
+
     def __init__(
         self,
         file_path: str,
@@ -606,20 +939,15 @@ class AmazonS3FileWriter(_FileWriter):
         super().__init__(file_path=file_path)
 
         self.__file = bucket.Object(key=file_path)
-        # NOTE: If uploading file in chunks, then initiate
-        # multipart-upload, including any metadata that 
-        # may exist. Else, store the metadata dictionary
-        # so as to include them during the bulk upload.
-        if chunk_size is not None:
-            if metadata is None:
-                self.__mpu = self.__file.initiate_multipart_upload()
-            else:
-                self.__mpu = self.__file.initiate_multipart_upload(
-                    Metadata=metadata)
-            self.__parts = list()
-        else:
-            self.__mpu = None
-            self.__metadata = metadata
+        self.__metadata = metadata
+        # NOTE: If uploading file in chunks, then a multipart
+        #       upload is initiated as soon as a second chunk is
+        #       written, until which the first chunk is held back.
+        #       This way, files that consist of a single chunk at
+        #       most are uploaded via a single request.
+        self.__mpu = None
+        self.__parts = list() if chunk_size is not None else None
+        self.__pending = None
         
 
     def close(self) -> None:
@@ -632,6 +960,9 @@ class AmazonS3FileWriter(_FileWriter):
         #       class instance.
         if self.__mpu is not None:
             self.__mpu.complete(MultipartUpload={'Parts': self.__parts})
+        elif self.__parts is not None:
+            self.__put(body=(
+                self.__pending if self.__pending is not None else b''))
 
 
     def _write_impl(self, chunk: bytes) -> int:
@@ -642,23 +973,70 @@ class AmazonS3FileWriter(_FileWriter):
         :param bytes chunk: The chunk of bytes that \
             is to be written to the file.
         '''
-        if self.__mpu is None:
+        if self.__parts is None:
+            if len(chunk) < _S3_MULTIPART_THRESHOLD:
+                # NOTE: Upload the bytes directly, instead of going
+                #       through the transfer manager, which would wrap
+                #       them in a buffer and read them back in pieces.
+                self.__put(body=chunk)
+                return len(chunk)
+            chunk_size, concurrency = _tune(len(chunk))
+            config = _TransferConfig(
+                multipart_threshold=_S3_MULTIPART_THRESHOLD,
+                multipart_chunksize=chunk_size,
+                max_concurrency=concurrency,
+                use_threads=True)
             with _io.BytesIO(chunk) as buffer:
                 self.__file.upload_fileobj(
                     Fileobj=buffer,
                     ExtraArgs={ "Metadata": self.__metadata }
-                        if self.__metadata is not None else None)
+                        if self.__metadata is not None else None,
+                    Config=config)
+        elif self.__mpu is None and self.__pending is None:
+            self.__pending = chunk
         else:
-            part_number = len(self.__parts) + 1
-            part = self.__mpu.Part(part_number=part_number)
-            response = part.upload(Body=chunk)
-            self.__parts.append({
-                'PartNumber': part_number,
-                'ETag': response['ETag']
-            })
+            if self.__mpu is None:
+                if self.__metadata is None:
+                    self.__mpu = self.__file.initiate_multipart_upload()
+                else:
+                    self.__mpu = self.__file.initiate_multipart_upload(
+                        Metadata=self.__metadata)
+                self.__upload_part(chunk=self.__pending)
+                self.__pending = None
+            self.__upload_part(chunk=chunk)
         return len(chunk)
 
 
+    def __put(self, body: bytes) -> None:
+        '''
+        Uploads the provided bytes as the \
+        whole file via a single request.
+
+        :param bytes body: The file's contents.
+        '''
+        self.__file.put(
+            Body=body,
+            **({ "Metadata": self.__metadata }
+                if self.__metadata is not None else {}))
+
+
+    def __upload_part(self, chunk: bytes) -> None:
+        '''
+        Uploads the provided chunk as the next \
+        part of the multipart upload.
+
+        :param bytes chunk: The chunk of bytes that \
+            is to be uploaded.
+        '''
+        part_number = len(self.__parts) + 1
+        part = self.__mpu.Part(part_number=part_number)
+        response = part.upload(Body=chunk)
+        self.__parts.append({
+            'PartNumber': part_number,
+            'ETag': response['ETag']
+        })
+
+
 class AzureBlobReader(_FileReader):
     '''
     A class used in reading from files which \
@@ -672,6 +1050,8 @@ class AzureBlobReader(_FileReader):
         ``ContainerClient`` class instance.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(
         self,
         file_path: str,
@@ -713,7 +1093,8 @@ class AzureBlobReader(_FileReader):
         '''
         return self.__file.download_blob(
             offset=start,
-            length=end-start).read()
+            length=end-start,
+            max_concurrency=_tune(end - start)[1]).read()
 
 
 class AzureBlobWriter(_FileWriter):
@@ -735,12 +1116,18 @@ class AzureBlobWriter(_FileWriter):
         ``ContainerClient`` class instance.
     '''
 
+    __slots__ = (
+        '__file',
+        '__metadata',
+        '__chunk_size'
+    )
+
     def __init__(
         self,
         file_path: str,
         metadata: _Optional[dict[str, str]],
         chunk_size: _Optional[int],
-        container: _ContainerClient,
+        container: _ContainerClient
     ) -> None:
         '''
         A class used in writing to files which \
@@ -809,7 +1196,8 @@ class AzureBlobWriter(_FileWriter):
                 data=chunk,
                 length=n,
                 metadata=self.__metadata,
-                overwrite=True)
+                overwrite=True,
+                max_concurrency=_tune(n)[1])
         else:
             self.__file.append_block(
                 data=chunk,
@@ -829,6 +1217,8 @@ class GCPFileReader(_FileReader):
     :param Bucket bucket: A ``Bucket`` class instance.
     '''
 
+    __slots__ = ('__file',)
+
     def __init__(
         self,
         file_path: str,
@@ -891,6 +1281,15 @@ class GCPFileWriter(_FileWriter):
         written as a single chunk of bytes.
     :param Bucket bucket: A ``Bucket`` class instance.
     '''
+
+    __slots__ = (
+        '__file',
+        '__metadata',
+        '__rus',
+        '__transport',
+        '__stream'
+    )
+
     def __init__(
         self,
         file_path: str,
@@ -17,8 +17,10 @@ __all__ = [
 import os as _os
 import typing as _typ
 import warnings as _warn
+import threading as _threading
 from abc import ABC as _ABC
 from abc import abstractmethod as _absmethod
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
 
 
 from tqdm import tqdm as _tqdm
@@ -35,6 +37,9 @@ from ._handlers import SSHClientHandler as _SSHClientHandler
 from ._handlers import AWSClientHandler as _AWSClientHandler
 from ._handlers import AzureClientHandler as _AzureClientHandler
 from ._handlers import GCPClientHandler as _GCPClientHandler
+from ._handlers import _SFTP_WINDOW_SIZE
+from ._handlers import _SFTP_MAX_PACKET_SIZE
+from ._handlers import _S3_MAX_POOL_CONNECTIONS
 from ._helper import join_paths as _join_paths
 from ._helper import infer_separator as _infer_sep
 from ._exceptions import InvalidPathError as _IPE
@@ -314,7 +319,13 @@ class _File(_ABC):
             else:
                 metadata = None
             # Perform the file transfer.
+            # NOTE: The reader already knows the file's size,
+            #       so there is no need to fetch it once more
+            #       for the progress bar.
             with (
+                self.__handler.get_reader(
+                    file_path=self.get_path()
+                ) as reader,
                 _tqdm(
                     disable=(
                         suppress_output or
@@ -322,11 +333,8 @@ class _File(_ABC):
                     ),
                     desc="Progress",
                     unit='bytes',
-                    total=self.get_size()
+                    total=reader.get_file_size()
                 ) as progress,
-                self.__handler.get_reader(
-                    file_path=self.get_path()
-                ) as reader,
                 dst._get_handler().get_writer(
                     file_path=dst_fp,
                     metadata=metadata,
@@ -334,7 +342,7 @@ class _File(_ABC):
                 ) as writer
             ):
                 if chunk_size is None:
-                    writer.write(reader.read())
+                    writer.write_from(reader)
                 else:
                     for chunk in reader.read_chunks(chunk_size):
                         progress.update(n=writer.write(chunk))
@@ -595,6 +603,10 @@ class RemoteFile(_NonLocalFile):
     :param bool cache: Indicates whether it is allowed for \
         any fetched data to be cached for faster subsequent \
         access. Defaults to ``False``.
+    :param int window_size: The size in bytes of the \
+        SFTP channel's window. Defaults to ``128 MiB``.
+    :param int max_packet_size: The maximum size in bytes \
+        of the SFTP channel's packets. Defaults to ``32 KiB``.
 
     :raises InvalidPathError: The provided path \
         does not exist.
@@ -606,7 +618,9 @@ class RemoteFile(_NonLocalFile):
         self,
         auth: _RemoteAuth,
         path: str,
-        cache: bool = False
+        cache: bool = False,
+        window_size: int = _SFTP_WINDOW_SIZE,
+        max_packet_size: int = _SFTP_MAX_PACKET_SIZE
     ):
         '''
         This class represents a file which resides \
@@ -619,6 +633,10 @@ class RemoteFile(_NonLocalFile):
         :param bool cache: Indicates whether it is allowed for \
             any fetched data to be cached for faster subsequent \
             access. Defaults to ``False``.
+        :param int window_size: The size in bytes of the \
+            SFTP channel's window. Defaults to ``128 MiB``.
+        :param int max_packet_size: The maximum size in bytes \
+            of the SFTP channel's packets. Defaults to ``32 KiB``.
 
         :raises InvalidPathError: The provided path \
             does not exist.
@@ -631,7 +649,9 @@ class RemoteFile(_NonLocalFile):
             path=path,
             handler=_SSHClientHandler(
                 auth=auth,
-                cache=_DirCache(path) if cache else None))
+                cache=_DirCache(path) if cache else None,
+                window_size=window_size,
+                max_packet_size=max_packet_size))
 
 
     def get_hostname(self) -> str:
@@ -756,6 +776,9 @@ class AmazonS3File(_CloudFile):
     :param bool cache: Indicates whether it is allowed for \
         any fetched data to be cached for faster subsequent \
         access. Defaults to ``False``.
+    :param int max_pool_connections: The maximum number \
+        of HTTP connections that are kept open to Amazon S3. \
+        Defaults to ``64``.
 
     :raises BucketNotFoundError: The specified \
         bucket does not exist.
@@ -777,7 +800,8 @@ class AmazonS3File(_CloudFile):
         bucket: str,
         path: str,
         load_metadata: bool = False,
-        cache: bool = False
+        cache: bool = False,
+        max_pool_connections: int = _S3_MAX_POOL_CONNECTIONS
     ):
         '''
         This class represents an object which resides \
@@ -794,6 +818,9 @@ class AmazonS3File(_CloudFile):
         :param bool cache: Indicates whether it is allowed for \
             any fetched data to be cached for faster subsequent \
             access. Defaults to ``False``.
+        :param int max_pool_connections: The maximum number \
+            of HTTP connections that are kept open to Amazon S3. \
+            Defaults to ``64``.
 
         :raises BucketNotFoundError: The specified \
             bucket does not exist.
@@ -814,7 +841,8 @@ class AmazonS3File(_CloudFile):
             handler=_AWSClientHandler(
                 auth=auth,
                 bucket=bucket,
-                cache=_DirCache(path) if cache else None))
+                cache=_DirCache(path) if cache else None,
+                max_pool_connections=max_pool_connections))
         
 
     def get_bucket_name(self) -> str:
@@ -1456,6 +1484,7 @@ class _Directory(_ABC):
         chunk_size: _typ.Optional[int] = None,
         filter: _typ.Optional[_typ.Callable[[str], bool]] = None,
         suppress_output: bool = False,
+        max_workers: int = 1
     ) -> bool:
         '''
         Copies all files within this directory into \
@@ -1489,6 +1518,16 @@ class _Directory(_ABC):
             transfer (``True``) or not (``False``). Defaults to ``None``.
         :param bool suppress_output: If set to ``True``, then \
             suppresses all output. Defaults to ``False``.
+        :param int max_workers: The maximum number of files \
+            that are to be transferred concurrently. Defaults \
+            to ``1``, meaning that files are transferred one \
+            after the other. If greater than ``1``, then any \
+            exception raised while transferring a file does not \
+            propagate, but counts as a failed transfer instead.
+
+        :note: Files are always transferred one after the other \
+            if either directory resides within a Google Cloud \
+            Storage bucket, regardless of ``max_workers``.
 
         :raises InvalidChunkSizeError: Transferring files in chunks of \
             the given size is not supported by the specified destination.
@@ -1512,41 +1551,96 @@ class _Directory(_ABC):
             print("Listing operation completed.")
 
         total_num_files = len(file_paths)
-        failures = 0
         dst_dirs = dict()
+        transfers = []
 
-        # Iterate through all files that are to be transferred.
-        for i, fp in enumerate(file_paths):
+        # Pair each file with its destination directory.
+        # NOTE: This is done beforehand so that no directory
+        #       instances are created while transferring files.
+        dst_sep = dst._get_separator()
+        for fp in file_paths:
 
             # Define src and dst paths.
             rel_fp = self._to_relative(path=fp, replace_sep=False)
-            dst_sep = dst._get_separator()
             dst_fp = (dst_sep
                 .join(dst._to_absolute(path=rel_fp, replace_sep=True)
                 .split(dst_sep)[:-1])
                 + dst_sep)
-            
-            # Fetch src file and dst directory.
-            src_file = self.get_file(path=fp)
 
+            # Fetch dst directory.
             if dst_fp in dst_dirs:
                 dst_dir = dst_dirs[dst_fp]
             else:
                 dst_dir = dst._get_subdir_impl(dst_fp)
                 dst_dirs.update({dst_fp: dst_dir})
 
-            # Perform the transfer.
-            if not src_file.transfer_to(
-                dst=dst_dir,
-                overwrite=overwrite,
-                include_metadata=include_metadata,
-                chunk_size=chunk_size,
-                suppress_output=suppress_output
-            ):
-                failures += 1
+            transfers.append((fp, dst_dir))
 
-            if not suppress_output:
-                print(f"Total progress: {i+1}/{total_num_files} files.")
+        # NOTE: Transfer files one after the other in case
+        #       either handler cannot be shared among threads.
+        if not (
+            self.__handler.is_thread_safe() and
+            dst._get_handler().is_thread_safe()
+        ):
+            max_workers = 1
+
+        completed, failures = 0, 0
+        lock = _threading.Lock()
+
+        def transfer(fp: str, dst_dir: '_Directory') -> None:
+            nonlocal completed, failures
+            # Fetch src file and perform the transfer.
+            try:
+                success = self.get_file(path=fp).transfer_to(
+                    dst=dst_dir,
+                    overwrite=overwrite,
+                    include_metadata=include_metadata,
+                    chunk_size=chunk_size,
+                    suppress_output=suppress_output)
+            except Exception as e:
+                # NOTE: Only count exceptions as failures when
+                #       transferring files concurrently, so that
+                #       they do not abort any other worker threads.
+                if max_workers == 1:
+                    raise e
+                if not suppress_output:
+                    print(f"Operation unsuccessful: {e}")
+                success = False
+            with lock:
+                completed += 1
+                if not success:
+                    failures += 1
+                if not suppress_output:
+                    print(f"Total progress: {completed}/{total_num_files} files.")
+
+        iterator = iter(transfers)
+
+        def transfer_all() -> None:
+            # NOTE: Each worker thread may be assigned its own
+            #       connections, which are to be closed as soon
+            #       as there are no more files to transfer.
+            try:
+                while True:
+                    with lock:
+                        t = next(iterator, None)
+                    if t is None:
+                        break
+                    transfer(*t)
+            finally:
+                if max_workers > 1:
+                    self.__handler.close_thread_connections()
+                    dst._get_handler().close_thread_connections()
+
+        # Iterate through all files that are to be transferred.
+        if max_workers > 1:
+            with _ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for future in [
+                    executor.submit(transfer_all)
+                    for _ in range(min(max_workers, total_num_files))
+                ]:
+                    future.result()
+        else:
+            transfer_all()
 
         if failures == 0:
             if not suppress_output:
@@ -2083,6 +2177,15 @@ class RemoteDir(_NonLocalDir):
         to which the provided path points will be automatically created \
         in case it does not already exist, instead of an exception being \
         thrown. Defaults to ``False``.
+    :param int window_size: The size in bytes of the \
+        SFTP channel's window. Defaults to ``128 MiB``.
+    :param int max_packet_size: The maximum size in bytes \
+        of the SFTP channel's packets. Defaults to ``32 KiB``.
+    :param bool allow_exec: Indicates whether it is allowed \
+        to execute ``mkdir -p`` on the remote server in order \
+        to create any missing directories via a single request, \
+        instead of creating them one by one via SFTP. Defaults \
+        to ``False``.
 
     :raises InvalidPathError: The provided path \
         does not exist.
@@ -2094,7 +2197,10 @@ class RemoteDir(_NonLocalDir):
         auth: _RemoteAuth,
         path: str,
         cache: bool = False,
-        create_if_missing: bool = False
+        create_if_missing: bool = False,
+        window_size: int = _SFTP_WINDOW_SIZE,
+        max_packet_size: int = _SFTP_MAX_PACKET_SIZE,
+        allow_exec: bool = False
     ):
         '''
         This class represents a directory which resides \
@@ -2111,6 +2217,15 @@ class RemoteDir(_NonLocalDir):
             to which the provided path points will be automatically created \
             in case it does not already exist, instead of an exception being \
             thrown. Defaults to ``False``.
+        :param int window_size: The size in bytes of the \
+            SFTP channel's window. Defaults to ``128 MiB``.
+        :param int max_packet_size: The maximum size in bytes \
+            of the SFTP channel's packets. Defaults to ``32 KiB``.
+        :param bool allow_exec: Indicates whether it is allowed \
+            to execute ``mkdir -p`` on the remote server in order \
+            to create any missing directories via a single request, \
+            instead of creating them one by one via SFTP. Defaults \
+            to ``False``.
 
         :raises InvalidPathError: The provided path \
             does not exist.
@@ -2127,7 +2242,10 @@ class RemoteDir(_NonLocalDir):
             create_if_missing=create_if_missing,
             handler=_SSHClientHandler(
                 auth=auth,
-                cache=_DirCache(path) if cache else None))
+                cache=_DirCache(path) if cache else None,
+                window_size=window_size,
+                max_packet_size=max_packet_size,
+                allow_exec=allow_exec))
 
 
     def get_hostname(self) -> str:
@@ -2363,6 +2481,9 @@ class AmazonS3Dir(_CloudDir):
         to which the provided path points will be automatically created \
         in case it does not already exist, instead of an exception being \
         thrown. Defaults to ``False``.
+    :param int max_pool_connections: The maximum number \
+        of HTTP connections that are kept open to Amazon S3. \
+        Defaults to ``64``.
 
     :raises BucketNotFoundError: The specified \
         bucket does not exist.
@@ -2383,7 +2504,8 @@ class AmazonS3Dir(_CloudDir):
         bucket: str,
         path: _typ.Optional[str] = None,
         cache: bool = False,
-        create_if_missing: bool = False
+        create_if_missing: bool = False,
+        max_pool_connections: int = _S3_MAX_POOL_CONNECTIONS
     ):
         '''
         This class represents a virtual directory which resides \
@@ -2403,6 +2525,9 @@ class AmazonS3Dir(_CloudDir):
             to which the provided path points will be automatically created \
             in case it does not already exist, instead of an exception being \
             thrown. Defaults to ``False``.
+        :param int max_pool_connections: The maximum number \
+            of HTTP connections that are kept open to Amazon S3. \
+            Defaults to ``64``.
 
         :raises BucketNotFoundError: The specified \
             bucket does not exist.
@@ -2423,7 +2548,8 @@ class AmazonS3Dir(_CloudDir):
             handler=_AWSClientHandler(
                 auth=auth,
                 bucket=bucket,
-                cache=_DirCache(path) if cache else None))
+                cache=_DirCache(path) if cache else None,
+                max_pool_connections=max_pool_connections))
 
 
     def get_bucket_name(self) -> str:
@@ -3,6 +3,7 @@ import io
 import sys
 import time
 import shutil
+import tempfile
 import unittest
 from uuid import uuid4
 from unittest.mock import Mock, patch
@@ -383,7 +384,8 @@ class MockContainerClient():
         def download_blob(
             self,
             offset: Optional[int] = None,
-            length: Optional[int] = None
+            length: Optional[int] = None,
+            max_concurrency: int = 1
         ):
             file_path = to_abs(self.blob_name)
             return MockContainerClient.MockStreamStorageDownloader(
@@ -399,7 +401,8 @@ class MockContainerClient():
             data: bytes,
             length: int,
             metadata: Optional[dict[str, str]],
-            overwrite: bool
+            overwrite: bool,
+            max_concurrency: int = 1
         ):
             name = self.blob_name
             # Raise error if file exists and overwrite
@@ -690,6 +693,56 @@ class TestLocalFile(unittest.TestCase):
         # Remove copy of the file.
         os.remove(copy_path)
 
+    @patch('os.sendfile', Mock(side_effect=OSError()))
+    @patch('os.copy_file_range', Mock(side_effect=OSError()), create=True)
+    def test_transfer_to_on_kernel_copy_failure(self):
+        file = self.build_file()
+        dir = TestLocalDir.build_dir(path=ABS_DIR_PATH)
+
+        # Copy file into dir.
+        file.transfer_to(dst=dir)
+
+        # Confirm that file was indeed copied.
+        copy_path = join_paths(ABS_DIR_PATH, FILE_NAME)
+
+        with (
+            open(ABS_FILE_PATH, mode='rb') as file,
+            open(copy_path, mode='rb') as copy
+        ):
+            self.assertEqual(file.read(), copy.read())
+
+        # Remove copy of the file.
+        os.remove(copy_path)
+
+    @patch('os.sendfile', Mock(side_effect=OSError()))
+    @patch('os.copy_file_range', Mock(side_effect=OSError()), create=True)
+    def test_transfer_to_on_full_buffer_pool(self):
+        import queue
+        file = self.build_file()
+        dir = TestLocalDir.build_dir(path=ABS_DIR_PATH)
+
+        # Copy file into dir while the buffer pool is full.
+        with patch('fluke._iohandlers._BUF_POOL', Mock(
+            get_nowait=Mock(side_effect=queue.Empty()),
+            put_nowait=Mock(side_effect=queue.Full())
+        )) as pool:
+            file.transfer_to(dst=dir)
+            # Confirm that the buffer was not kept.
+            pool.put_nowait.assert_called_once()
+            pool.put.assert_not_called()
+
+        # Confirm that file was indeed copied.
+        copy_path = join_paths(ABS_DIR_PATH, FILE_NAME)
+
+        with (
+            open(ABS_FILE_PATH, mode='rb') as file,
+            open(copy_path, mode='rb') as copy
+        ):
+            self.assertEqual(file.read(), copy.read())
+
+        # Remove copy of the file.
+        os.remove(copy_path)
+
     def test_transfer_to_on_overwrite_error(self):
         file = self.build_file()
         dir = TestLocalDir.build_dir(path=ABS_DIR_PATH)
@@ -754,6 +807,81 @@ class TestRemoteFile(unittest.TestCase):
         with self.build_file() as file:
             self.assertEqual(file.get_path(), f"/{REL_FILE_PATH}")
 
+    def test_constructor_on_pooled_connection(self):
+        with self.build_file():
+            pass
+        with (
+            patch('paramiko.SSHClient.connect') as connect,
+            self.build_file()
+        ):
+            connect.assert_not_called()
+
+    def test_constructor_on_stale_pooled_connection(self):
+        import paramiko
+        with self.build_file():
+            pass
+        from_transport = paramiko.SFTPClient.from_transport
+        calls = []
+
+        # Fail to open an SFTP session over the pooled connection.
+        def open_sftp(*args, **kwargs):
+            calls.append(None)
+            if len(calls) == 1:
+                raise paramiko.SSHException()
+            return from_transport(*args, **kwargs)
+
+        with (
+            patch('paramiko.SFTPClient.from_transport', side_effect=open_sftp),
+            patch.object(
+                paramiko.SSHClient,
+                'connect',
+                autospec=True,
+                side_effect=paramiko.SSHClient.connect
+            ) as connect
+        ):
+            with self.build_file() as file:
+                self.assertEqual(file.read(), b'TEXT')
+            # Assert that a new connection was established.
+            connect.assert_called_once()
+
+    def test_close_on_idle_connection_eviction(self):
+        from fluke._handlers import _SSHConnectionPool
+        pool = _SSHConnectionPool(max_pool_size=1, max_idle_time=0.1)
+        ssh = Mock()
+        pool.release(key=('a', ), ssh=ssh)
+        ssh.close.assert_not_called()
+        time.sleep(0.5)
+        ssh.close.assert_called_once()
+        self.assertIsNone(pool.get(key=('a', )))
+
+    def test_close_on_idle_connection_eviction_on_other_key(self):
+        from fluke._handlers import _SSHConnectionPool
+        pool = _SSHConnectionPool(max_pool_size=1, max_idle_time=60.0)
+        ssh = Mock()
+        pool.release(key=('a', ), ssh=ssh)
+        with patch('time.monotonic', return_value=time.monotonic() + 120.0):
+            self.assertIsNone(pool.get(key=('b', )))
+        ssh.close.assert_called_once()
+        pool.clear()
+        ssh.close.assert_called_once()
+
+    def test_constructor_on_window_and_packet_size(self):
+        import paramiko
+        with patch(
+            'paramiko.SFTPClient.from_transport',
+            wraps=paramiko.SFTPClient.from_transport
+        ) as from_transport:
+            with RemoteFile(
+                auth=get_remote_auth_instance(),
+                path=f"/{REL_FILE_PATH}",
+                window_size=2**20,
+                max_packet_size=2**14
+            ) as file:
+                self.assertEqual(file.read(), b'TEXT')
+            _, kwargs = from_transport.call_args
+            self.assertEqual(kwargs['window_size'], 2**20)
+            self.assertEqual(kwargs['max_packet_size'], 2**14)
+
     def test_constructor_on_invalid_path_error(self):
         self.assertRaises(InvalidPathError, self.build_file, path="NON_EXISTING_PATH")
 
@@ -972,6 +1100,18 @@ class TestRemoteFile(unittest.TestCase):
         file.close()
         self.assertFalse(file._get_handler().is_open())
 
+    def test_close_on_no_new_connections(self):
+        from concurrent.futures import ThreadPoolExecutor
+        file = self.build_file()
+        file.close()
+        handler = file._get_handler()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(handler.path_exists, REL_FILE_PATH)
+            self.assertRaises(AttributeError, future.result)
+        self.assertRaises(AttributeError, handler.path_exists, REL_FILE_PATH)
+        self.assertEqual(len(handler._SSHClientHandler__thread_conns), 0)
+        self.assertFalse(handler.is_open())
+
     '''
     Test cache methods.
     '''
@@ -1093,6 +1233,16 @@ class TestAmazonS3File(unittest.TestCase):
     def test_constructor_on_bucket_not_found_error(self):
         self.assertRaises(BucketNotFoundError, self.build_file, bucket='UNKNOWN')
 
+    def test_constructor_on_max_pool_connections(self):
+        with AmazonS3File(
+            auth=get_aws_auth_instance(),
+            bucket=BUCKET,
+            path=REL_FILE_PATH,
+            max_pool_connections=5
+        ) as file:
+            client = file._get_handler()._AWSClientHandler__get_bucket().meta.client
+            self.assertEqual(client.meta.config.max_pool_connections, 5)
+
     def test_get_name(self):
         with self.build_file() as file:
             self.assertEqual(file.get_name(), FILE_NAME)
@@ -1180,6 +1330,12 @@ class TestAmazonS3File(unittest.TestCase):
             data, start, end = b"", 100, 1
             self.assertEqual(data, file.read_range(start, end))
 
+    @patch('fluke._iohandlers._tune', Mock(return_value=(1, 2)))
+    def test_read_range_on_multiple_parts(self):
+        data, start, end = b"EXT", 1, 4
+        with self.build_file() as file:
+            self.assertEqual(data, file.read_range(start, end))
+
     def test_read_text(self):
         with self.build_file() as file:
             data = "TEXT"
@@ -1225,6 +1381,20 @@ class TestAmazonS3File(unittest.TestCase):
             # Remove copy of the file.
             os.remove(copy_path)
 
+    def test_transfer_to_on_single_size_request(self):
+        from fluke._handlers import AWSClientHandler
+        mock = AWSClientHandler._get_file_size_impl
+        with self.build_file() as file:
+            mock.reset_mock()
+            # Copy file into dir.
+            file.transfer_to(
+                dst=TestLocalDir.build_dir(path=ABS_DIR_PATH),
+                chunk_size=1)
+            # Remove copy of the file.
+            os.remove(join_paths(ABS_DIR_PATH, FILE_NAME))
+            # Assert that the file's size was fetched only once.
+            self.assertEqual(mock.call_count, 1)
+
     def test_transfer_to_on_chunk_size(self):
         with self.build_file() as file:
             # Copy file into dir.
@@ -1306,6 +1476,18 @@ class TestAmazonS3File(unittest.TestCase):
         file.close()
         self.assertFalse(file._get_handler().is_open())
 
+    def test_close_on_no_new_connections(self):
+        from concurrent.futures import ThreadPoolExecutor
+        file = self.build_file()
+        file.close()
+        handler = file._get_handler()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(handler.path_exists, REL_FILE_PATH)
+            self.assertRaises(AttributeError, future.result)
+        self.assertRaises(AttributeError, handler.path_exists, REL_FILE_PATH)
+        self.assertEqual(len(handler._AWSClientHandler__thread_buckets), 0)
+        self.assertFalse(handler.is_open())
+
     '''
     Test cache methods.
     '''
@@ -2347,6 +2529,51 @@ class TestLocalDir(unittest.TestCase):
             ):
                 self.assertEqual(of.read(), cp.read())
 
+    @create_tmp_dir
+    def test_transfer_to_on_max_workers(self, tmp_dir_path):
+        # Recursively copy the directory's contents
+        # into this tmp directory, using many threads.
+        self.build_dir(path=ABS_DIR_PATH).transfer_to(
+            dst=self.build_dir(path=tmp_dir_path),
+            recursively=True,
+            max_workers=4)
+        # Assert that the two directories contains the same contents.
+        original = sorted(os.path.relpath(join_paths(dp, f), ABS_DIR_PATH)
+                          for dp, _, fn in os.walk(ABS_DIR_PATH) for f in fn)
+        copies = sorted(os.path.relpath(join_paths(dp, f), tmp_dir_path)
+                        for dp, _, fn in os.walk(tmp_dir_path) for f in fn)
+        # 1. Assert that the same files were copied.
+        self.assertEqual(original, copies)
+        # 2. Iterate over all files.
+        for fp in original:
+            # Assert their contents are the same.
+            with (
+                open(file=join_paths(ABS_DIR_PATH, fp), mode='rb') as of,
+                open(file=join_paths(tmp_dir_path, fp), mode='rb') as cp
+            ):
+                self.assertEqual(of.read(), cp.read())
+
+    @create_tmp_dir
+    def test_transfer_to_on_max_workers_on_failure(self, tmp_dir_path):
+        # Fail to fetch any of the files that are to be copied.
+        with patch.object(LocalDir, 'get_file', side_effect=OSError()):
+            self.assertFalse(self.build_dir(path=ABS_DIR_PATH).transfer_to(
+                dst=self.build_dir(path=tmp_dir_path),
+                recursively=True,
+                max_workers=4))
+        # Assert that no file has been copied.
+        self.assertEqual(os.listdir(tmp_dir_path), [])
+
+    @create_tmp_dir
+    def test_transfer_to_on_failure(self, tmp_dir_path):
+        # Fail to fetch any of the files that are to be copied.
+        with patch.object(LocalDir, 'get_file', side_effect=OSError()):
+            self.assertRaises(
+                OSError,
+                self.build_dir(path=ABS_DIR_PATH).transfer_to,
+                dst=self.build_dir(path=tmp_dir_path),
+                recursively=True)
+
     @create_tmp_dir
     def test_transfer_to_on_chunk_size(self, tmp_dir_path):
         # Copy the directory's contents into this tmp directory.
@@ -2826,6 +3053,62 @@ class TestRemoteDir(unittest.TestCase):
             ):
                 self.assertEqual(of.read(), cp.read())
 
+    @create_tmp_dir
+    def test_transfer_to_on_max_workers(self, tmp_dir_path):
+        # Copy the directory's contents into a tmp
+        # directory, using many threads.
+        with self.build_dir() as dir:
+            dir.transfer_to(
+                dst=LocalDir(path=tmp_dir_path),
+                recursively=True,
+                max_workers=4)
+        # Assert that the two directories contains the same contents.
+        original = sorted(os.path.relpath(join_paths(dp, f), ABS_DIR_PATH)
+                          for dp, _, fn in os.walk(ABS_DIR_PATH) for f in fn)
+        copies = sorted(os.path.relpath(join_paths(dp, f), tmp_dir_path)
+                        for dp, _, fn in os.walk(tmp_dir_path) for f in fn)
+        # 1. Assert that the same files were copied.
+        self.assertEqual(original, copies)
+        # 2. Iterate over all files.
+        for fp in original:
+            # Assert their contents are the same.
+            with (
+                open(file=join_paths(ABS_DIR_PATH, fp), mode='rb') as of,
+                open(file=join_paths(tmp_dir_path, fp), mode='rb') as cp
+            ):
+                self.assertEqual(of.read(), cp.read())
+
+    @create_tmp_dir
+    def test_transfer_to_on_max_workers_on_connection_release(self, tmp_dir_path):
+        from fluke._handlers import SSHClientHandler, _SSH_POOL
+        connect = SSHClientHandler._SSHClientHandler__connect
+        with (
+            self.build_dir() as dir,
+            patch.object(
+                SSHClientHandler,
+                '_SSHClientHandler__connect',
+                autospec=True,
+                side_effect=connect
+            ) as connect_mock,
+            patch.object(
+                _SSH_POOL,
+                'release',
+                wraps=_SSH_POOL.release
+            ) as release_mock
+        ):
+            # Copy the directory's contents into a tmp
+            # directory, using many threads.
+            dir.transfer_to(
+                dst=LocalDir(path=tmp_dir_path),
+                recursively=True,
+                max_workers=4)
+            # Assert that all connections that were opened
+            # by the worker threads have been released.
+            self.assertGreater(connect_mock.call_count, 0)
+            self.assertEqual(
+                connect_mock.call_count,
+                release_mock.call_count)
+
     @create_tmp_dir
     def test_transfer_to_on_chunk_size(self, tmp_dir_path):
         # Copy the directory's contents into a tmp directory.
@@ -2953,6 +3236,110 @@ class TestRemoteDir(unittest.TestCase):
             ):
                 self.assertEqual(file.read(), copy.read())
 
+    @staticmethod
+    def write_nested_files(remote_dir: RemoteDir, remote_path: str) -> None:
+        # Write files into missing nested directories.
+        for dir_path in ('a/b/c/', 'd/e/'):
+            with remote_dir._get_handler().get_writer(
+                file_path=f"{remote_path}{dir_path}{FILE_NAME}",
+                metadata=None,
+                chunk_size=None
+            ) as writer:
+                writer.write(b"TEXT")
+
+    def assert_nested_files(self, tmp_dir_path: str) -> None:
+        # Confirm that all files were indeed written.
+        for dir_path in ('a/b/c/', 'd/e/'):
+            with open(f"{tmp_dir_path}{dir_path}{FILE_NAME}", mode='rb') as file:
+                self.assertEqual(file.read(), b"TEXT")
+
+    @create_tmp_dir
+    def test_transfer_to_as_dst_on_exec_not_allowed(self, tmp_dir_path):
+        import paramiko
+        remote_path = tmp_dir_path.replace(f"{ABS_DIR_PATH.rstrip('dir/')}/", f"/{REL_DIR_PATH.rstrip('dir/')}/")
+        # Create a temporary "remote" dictionary.
+        with (
+            self.build_dir(path=remote_path) as remote_dir,
+            patch.object(
+                paramiko.Transport,
+                'open_session',
+                autospec=True,
+                side_effect=paramiko.Transport.open_session
+            ) as open_session
+        ):
+            self.write_nested_files(remote_dir, remote_path)
+            # Assert that no command was executed.
+            open_session.assert_not_called()
+        self.assert_nested_files(tmp_dir_path)
+
+    @create_tmp_dir
+    def test_transfer_to_as_dst_on_exec_allowed(self, tmp_dir_path):
+        import paramiko
+        remote_path = tmp_dir_path.replace(f"{ABS_DIR_PATH.rstrip('dir/')}/", f"/{REL_DIR_PATH.rstrip('dir/')}/")
+        # Create a temporary "remote" dictionary.
+        with (
+            RemoteDir(
+                auth=get_remote_auth_instance(),
+                path=remote_path,
+                allow_exec=True
+            ) as remote_dir,
+            patch.object(
+                paramiko.Channel,
+                'exec_command',
+                autospec=True,
+                side_effect=paramiko.Channel.exec_command
+            ) as exec_command
+        ):
+            self.write_nested_files(remote_dir, remote_path)
+            # Assert that a command was executed per missing directory.
+            self.assertEqual(exec_command.call_count, 2)
+        self.assert_nested_files(tmp_dir_path)
+
+    @create_tmp_dir
+    def test_transfer_to_as_dst_on_exec_failure(self, tmp_dir_path):
+        import paramiko
+        remote_path = tmp_dir_path.replace(f"{ABS_DIR_PATH.rstrip('dir/')}/", f"/{REL_DIR_PATH.rstrip('dir/')}/")
+        # Create a temporary "remote" dictionary.
+        with (
+            RemoteDir(
+                auth=get_remote_auth_instance(),
+                path=remote_path,
+                allow_exec=True
+            ) as remote_dir,
+            patch.object(
+                paramiko.Channel,
+                'recv_exit_status',
+                return_value=1
+            ) as recv_exit_status
+        ):
+            self.write_nested_files(remote_dir, remote_path)
+            # Assert that a non-zero exit status does
+            # not prevent executing any further commands.
+            self.assertEqual(recv_exit_status.call_count, 2)
+        self.assert_nested_files(tmp_dir_path)
+
+    @create_tmp_dir
+    def test_transfer_to_as_dst_on_exec_disabled(self, tmp_dir_path):
+        import paramiko
+        remote_path = tmp_dir_path.replace(f"{ABS_DIR_PATH.rstrip('dir/')}/", f"/{REL_DIR_PATH.rstrip('dir/')}/")
+        # Create a temporary "remote" dictionary.
+        with (
+            RemoteDir(
+                auth=get_remote_auth_instance(),
+                path=remote_path,
+                allow_exec=True
+            ) as remote_dir,
+            patch.object(
+                paramiko.Transport,
+                'open_session',
+                side_effect=paramiko.SSHException()
+            ) as open_session
+        ):
+            self.write_nested_files(remote_dir, remote_path)
+            # Assert that executing a command was attempted only once.
+            self.assertEqual(open_session.call_count, 1)
+        self.assert_nested_files(tmp_dir_path)
+
     @create_tmp_dir
     def test_transfer_to_as_dst_on_chunk_size(self, tmp_dir_path):
         # Get source file.
@@ -3622,6 +4009,31 @@ class TestAmazonS3Dir(unittest.TestCase):
                 get_aws_s3_object(BUCKET, ofp).download_fileobj(buffer)
                 self.assertEqual(buffer.getvalue(), cp.read())
 
+    @create_tmp_dir
+    def test_transfer_to_on_max_workers(self, tmp_dir_path):
+        # Copy the directory's contents into a tmp
+        # directory, using many threads.
+        with self.build_dir() as dir:
+            dir.transfer_to(
+                dst=TestLocalDir.build_dir(path=tmp_dir_path),
+                recursively=True,
+                max_workers=4)
+        # Assert that the two directories contains the same contents.
+        original = sorted(self.iterate_aws_s3_dir_objects(recursively=True))
+        copies = sorted(os.path.relpath(join_paths(dp, f), tmp_dir_path)
+                        for dp, _, fn in os.walk(tmp_dir_path) for f in fn)
+        # 1. Assert that the same files were copied.
+        self.assertEqual(original, copies)
+        # 2. Iterate over all files.
+        for fp in original:
+            # Assert their contents are the same.
+            with (
+                io.BytesIO() as buffer,
+                open(join_paths(tmp_dir_path, fp), mode='rb') as cp
+            ):
+                get_aws_s3_object(BUCKET, join_paths(REL_DIR_PATH, fp)).download_fileobj(buffer)
+                self.assertEqual(buffer.getvalue(), cp.read())
+
     @create_tmp_dir
     def test_transfer_to_on_chunk_size(self, tmp_dir_path):
         # Copy the directory's contents into a tmp directory.
@@ -3790,6 +4202,70 @@ class TestAmazonS3Dir(unittest.TestCase):
             # Delete object.
             obj.delete()
 
+    @create_tmp_s3_dir
+    def test_transfer_to_as_dst_on_chunk_size_on_empty_file(self, tmp_dir_path):
+        with tempfile.TemporaryDirectory() as local_dir_path:
+            # Create an empty source file.
+            src_path = join_paths(local_dir_path, FILE_NAME)
+            open(src_path, mode='wb').close()
+            with self.build_dir(path=tmp_dir_path) as s3_dir:
+                # Copy file into dir.
+                self.assertTrue(LocalFile(path=src_path).transfer_to(
+                    dst=s3_dir, chunk_size=5000000))
+                # Confirm that file was indeed copied.
+                obj = get_aws_s3_object(BUCKET, join_paths(tmp_dir_path, FILE_NAME))
+                self.assertEqual(obj.content_length, 0)
+                # Delete object.
+                obj.delete()
+
+    @create_tmp_s3_dir
+    def test_transfer_to_as_dst_on_multipart_upload(self, tmp_dir_path):
+        from boto3.s3.transfer import TransferConfig
+        contents = os.urandom(2048)
+        with tempfile.TemporaryDirectory() as local_dir_path:
+            src_path = join_paths(local_dir_path, FILE_NAME)
+            with open(src_path, mode='wb') as file:
+                file.write(contents)
+            # NOTE: Avoid "aws-chunked" uploads, which are not decoded by moto.
+            with (
+                patch.dict(os.environ, {'AWS_REQUEST_CHECKSUM_CALCULATION': 'when_required'}),
+                patch('fluke._iohandlers._S3_MULTIPART_THRESHOLD', 1024),
+                patch('fluke._iohandlers._TransferConfig', wraps=TransferConfig) as config,
+                self.build_dir(path=tmp_dir_path) as s3_dir
+            ):
+                # Copy file into dir.
+                self.assertTrue(LocalFile(path=src_path).transfer_to(dst=s3_dir))
+                # Confirm that a multipart upload was used.
+                config.assert_called_once()
+                self.assertEqual(config.call_args.kwargs['multipart_threshold'], 1024)
+                # Confirm that file was indeed copied.
+                obj = get_aws_s3_object(BUCKET, join_paths(tmp_dir_path, FILE_NAME))
+                self.assertEqual(obj.get()['Body'].read(), contents)
+                # Delete object.
+                obj.delete()
+
+    @create_tmp_s3_dir
+    def test_transfer_to_as_dst_on_single_put_request(self, tmp_dir_path):
+        from boto3.s3.transfer import TransferConfig
+        contents = os.urandom(2048)
+        with tempfile.TemporaryDirectory() as local_dir_path:
+            src_path = join_paths(local_dir_path, FILE_NAME)
+            with open(src_path, mode='wb') as file:
+                file.write(contents)
+            with (
+                patch('fluke._iohandlers._TransferConfig', wraps=TransferConfig) as config,
+                self.build_dir(path=tmp_dir_path) as s3_dir
+            ):
+                # Copy file into dir.
+                self.assertTrue(LocalFile(path=src_path).transfer_to(dst=s3_dir))
+                # Confirm that a single PutObject request was used.
+                config.assert_not_called()
+                # Confirm that file was indeed copied.
+                obj = get_aws_s3_object(BUCKET, join_paths(tmp_dir_path, FILE_NAME))
+                self.assertEqual(obj.get()['Body'].read(), contents)
+                # Delete object.
+                obj.delete()
+
     @create_tmp_s3_dir
     def test_transfer_to_as_dst_on_include_metadata(self, tmp_dir_path):
         # Get source file and metadata.